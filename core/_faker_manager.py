@@ -1,18 +1,28 @@
-from typing import Dict, Any
+import threading
+import numpy as np
+from typing import Dict, Any, Tuple
 
 
 class FakerManager:
-    """Manages Faker instances to avoid re-creating them for each column."""
+    """
+    Manages Faker instances to avoid re-creating them for each column.
+    Instances, custom providers and value pools are cached process-wide, so
+    constructing a new manager per request does not rebuild Faker's provider registry.
+    """
+    _lock = threading.RLock()
+    _instances: Dict[Tuple[str, Any], Any] = {}
+    _provider_map: Dict[str, Any] = {}
+    _pools: Dict[Tuple[str, Any, str], np.ndarray] = {}
+
     def __init__(self, default_locale: str = "en_US"):
         from faker import Faker
         self.Faker = Faker
         self.default_locale = default_locale
-        self._instances: Dict[str, Faker] = {}
-        self._provider_map: Dict[str, Any] = {}
 
     def add_provider_for_locale(self, locale: str, provider: Any):
         """Register a custom provider to be added for a specific locale."""
-        self._provider_map[locale] = provider
+        with self._lock:
+            FakerManager._provider_map[locale] = provider
 
     def get_instance(self, locale: str | None = None) -> Any:
         """
@@ -20,17 +30,40 @@ class FakerManager:
         If no locale is specified, uses the default.
         """
         target_locale = locale or self.default_locale
+        custom_provider = self._provider_map.get(target_locale)
+        key = (target_locale, custom_provider)
+
+        instance = self._instances.get(key)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(key)
+                if instance is None:
+                    print(f"  [DEBUG] Creating new Faker instance for locale '{target_locale}'")
+                    instance = self.Faker(target_locale)
+
+                    # Add a custom provider if one is registered for this locale
+                    if custom_provider:
+                        instance.add_provider(custom_provider)
+                        print(f"  [DEBUG] Added custom provider for '{target_locale}'")
+
+                    self._instances[key] = instance
 
-        if target_locale not in self._instances:
-            print(f"  [DEBUG] Creating new Faker instance for locale '{target_locale}'")
-            instance = self.Faker(target_locale)
-            
-            # Add a custom provider if one is registered for this locale
-            custom_provider = self._provider_map.get(target_locale)
-            if custom_provider:
-                instance.add_provider(custom_provider)
-                print(f"  [DEBUG] Added custom provider for '{target_locale}'")
+        return instance
 
-            self._instances[target_locale] = instance
+    def get_pool(self, method: str, locale: str | None = None, size: int = 10_000) -> np.ndarray:
+        """
+        Get a cached pool of pre-generated Faker values (e.g. 'name', 'word') for a locale.
+        Large columns sample from this pool instead of calling Faker once per row.
+        """
+        target_locale = locale or self.default_locale
+        key = (target_locale, self._provider_map.get(target_locale), method)
 
-        return self._instances[target_locale]
+        pool = self._pools.get(key)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(key)
+                if pool is None:
+                    fn = getattr(self.get_instance(target_locale), method)
+                    pool = np.array([fn() for _ in range(size)], dtype=object)
+                    self._pools[key] = pool
+        return pool
@@ -0,0 +1,10 @@
+import pandas as pd
+
+
+def copy_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Copy df so edits never reach the caller's frame.
+    The copy is shallow (columns are duplicated lazily) when the application has enabled pandas
+    copy-on-write, as main.py and server.py do; otherwise it is a full deep copy.
+    """
+    return df.copy(deep=pd.options.mode.copy_on_write is not True)
@@ -0,0 +1,24 @@
+import json
+from typing import Any, IO
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the stdlib json parser is used without it
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch this either way
+JSONDecodeError = json.JSONDecodeError
+
+
+def json_loads(data: str | bytes) -> Any:
+    """Decode a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_load(f: IO) -> Any:
+    """Decode a JSON document from an open file (text or binary mode)."""
+    if orjson is not None:
+        return orjson.loads(f.read())
+    return json.load(f)
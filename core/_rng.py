@@ -0,0 +1,16 @@
+import threading
+import numpy as np
+
+_local = threading.local()
+
+
+def get_rng() -> np.random.Generator:
+    """
+    Return the calling thread's numpy Generator (PCG64), creating it on first use.
+    Each thread draws from its own generator, so concurrent generation never
+    contends on the legacy global np.random state.
+    """
+    rng = getattr(_local, "rng", None)
+    if rng is None:
+        rng = _local.rng = np.random.default_rng()
+    return rng
@@ -1,13 +1,14 @@
-import math
 import pandas as pd
-from typing import List
+from typing import Iterator
 
-def split_into_batches(df: pd.DataFrame, batch_size: int) -> List[pd.DataFrame]:
-    """Return list of DataFrame batches"""
+def split_into_batches(df: pd.DataFrame, batch_size: int) -> Iterator[pd.DataFrame]:
+    """
+    Yield DataFrame batches of at most batch_size rows.
+    Batches are positional slices of df and keep its original index;
+    call .reset_index(drop=True) on a batch if a 0-based index is needed.
+    """
     if batch_size <= 0:
-        return [df]
-    n = len(df)
-    parts = []
-    for i in range(0, n, batch_size):
-        parts.append(df.iloc[i:i+batch_size].reset_index(drop=True))
-    return parts
+        yield df
+        return
+    for i in range(0, len(df), batch_size):
+        yield df.iloc[i:i+batch_size]
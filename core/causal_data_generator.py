@@ -1,6 +1,31 @@
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from typing import Dict, Any
+from ._rng import get_rng
+from ._frames import copy_frame
+
+
+@lru_cache(maxsize=256)
+def _compile_expr(expr: str):
+    """Compile an SCM expression once so repeated tables reuse the code object."""
+    return compile(expr, "<scm>", "eval")
+
+
+def _eval_columns(code, df: pd.DataFrame, noise, metadata: Dict[str, Any] = None):
+    """
+    Evaluate a compiled expression once against the column arrays.
+    Returns None when the expression doesn't vectorize (it raises, or doesn't yield one value per row).
+    """
+    columns = {c: df[c].to_numpy() for c in df.columns}
+    try:
+        result = eval(code, {"np": np, "noise": noise}, {**columns, **(metadata or {})})
+    except Exception:
+        return None
+    if np.shape(result) != (len(df),):
+        return None
+    return result
+
 
 def generate_causal_by_scm(df: pd.DataFrame, scm_spec: Dict[str, Any], metadata: Dict[str, Any] = None) -> pd.DataFrame:
     """
@@ -24,21 +49,36 @@ def generate_causal_by_scm(df: pd.DataFrame, scm_spec: Dict[str, Any], metadata:
     if not scm_spec:
         return df
 
-    df = df.copy()
+    df = copy_frame(df)
     local_env = {"np": np}
     if metadata:
         local_env.update(metadata)
 
+    n = len(df)
+
+    def noise(loc, scale, size=n):
+        return get_rng().normal(loc, scale, size)
+
+    def row_noise(loc, scale):
+        return get_rng().normal(loc, scale)
+
     for col, spec in scm_spec.items():
         expr = spec.get("fn")
         if not expr:
             continue
 
-        # replace noise(a,b) with np.random.normal(a,b)
-        expr_eval = expr.replace("noise(", "np.random.normal(")
         try:
-            df[col] = df.eval(expr_eval, local_dict=local_env)
+            df[col] = df.eval(expr, local_dict=local_env)
         except Exception:
-            # fallback row-wise safe eval
-            df[col] = df.apply(lambda row: eval(expr_eval, {"np": np, **row.to_dict(), **(metadata or {})}), axis=1)
+            # fallback (e.g. noise(a,b) terms): evaluate once against the column arrays, with per-row noise
+            code = _compile_expr(expr)
+            values = _eval_columns(code, df, noise, metadata)
+            if values is None:
+                # Scalar-only expressions (if/else, max(...), bare np.random calls): row-wise safe eval
+                values = df.apply(
+                    lambda row: eval(code, {"np": np, "noise": row_noise, **row.to_dict(), **(metadata or {})}),
+                    axis=1,
+                )
+            df[col] = values
     return df
+
@@ -1,9 +1,206 @@
 import numpy as np
-import random
-from typing import Dict, List, Any
+from faker.providers.date_time import Provider as DateTimeProvider
+from functools import lru_cache
+from typing import Dict, List, Any, Callable, Mapping, Tuple
 from ._faker_manager import FakerManager
+from ._rng import get_rng
 
-def generate_column(column_def: Dict[str, Any], n: int, faker_manager: FakerManager, table_locale: str | None) -> List[Any]:
+# Columns larger than this sample from a cached pool instead of calling Faker per row
+FAKER_POOL_SIZE = 10_000
+
+
+def _faker_values(faker_manager: FakerManager, locale: str | None, method: str, n: int) -> List[Any] | np.ndarray:
+    """Generate n values from a Faker method, sampling a pre-generated pool for large n."""
+    if n <= FAKER_POOL_SIZE:
+        fn = getattr(faker_manager.get_instance(locale), method)
+        return [fn() for _ in range(n)]
+    pool = faker_manager.get_pool(method, locale, FAKER_POOL_SIZE)
+    return pool[get_rng().integers(0, len(pool), size=n)]
+
+
+# -------------------------------
+# Per-type generators
+# All share the signature (dist, n, faker_manager, locale, table_data).
+# -------------------------------
+def _generate_name(dist, n, faker_manager, locale, table_data):
+    return _faker_values(faker_manager, locale, "name", n)
+
+
+def _generate_gendered_name(method: str) -> Callable:
+    def generate(dist, n, faker_manager, locale, table_data):
+        # Custom providers (e.g. TransliteratedArabicProvider) may offer a vectorized <method>_bulk
+        bulk = getattr(faker_manager.get_instance(locale), f"{method}_bulk", None)
+        if bulk is not None:
+            return bulk(n)
+        return _faker_values(faker_manager, locale, method, n)
+    return generate
+
+
+def _generate_custom_format(dist, n, faker_manager, locale, table_data):
+    pattern = dist.get("pattern") or ""
+    if not pattern:
+        return [""] * n
+    # Fill an (n, len(pattern)) buffer of UCS-4 code points: copy the pattern into every
+    # row, overwrite the '#' slots with random digits, then view each row as one string.
+    codes = np.frombuffer(pattern.encode("utf-32-le"), dtype="<u4")
+    buf = np.tile(codes, (n, 1))
+    slots = np.flatnonzero(codes == ord("#"))
+    buf[:, slots] = get_rng().integers(ord("0"), ord("9") + 1, size=(n, len(slots)), dtype=np.uint32)
+    return buf.view(f"<U{len(codes)}").ravel().tolist()
+
+
+class _AliasSampler:
+    """Walker's alias method: O(1) per draw regardless of the number of categories."""
+
+    def __init__(self, probs: Tuple[float, ...]):
+        p = np.asarray(probs, dtype=np.float64)
+        if np.any(p < 0) or not np.isclose(p.sum(), 1.0):
+            raise ValueError("probabilities must be non-negative and sum to 1")
+        k = len(p)
+        scaled = p * k
+        self.prob = np.ones(k)
+        self.alias = np.arange(k)
+        small = [i for i in range(k) if scaled[i] < 1.0]
+        large = [i for i in range(k) if scaled[i] >= 1.0]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] += scaled[s] - 1.0
+            (small if scaled[l] < 1.0 else large).append(l)
+
+    def sample(self, rng: np.random.Generator, n: int) -> np.ndarray:
+        i = rng.integers(0, len(self.prob), size=n)
+        return np.where(rng.random(n) < self.prob[i], i, self.alias[i])
+
+
+@lru_cache(maxsize=128)
+def _alias_sampler(probs: Tuple[float, ...]) -> _AliasSampler:
+    return _AliasSampler(probs)
+
+
+def _generate_categorical(dist, n, faker_manager, locale, table_data):
+    values = dist.get("values", [])
+    probs = dist.get("probabilities")
+    if values:
+        rng = get_rng()
+        if probs is None:
+            idx = rng.integers(0, len(values), size=n)
+        elif len(probs) != len(values):
+            raise ValueError("'values' and 'probabilities' must have the same length")
+        else:
+            idx = _alias_sampler(tuple(probs)).sample(rng, n)
+        return np.asarray(values)[idx]
+    return _faker_values(faker_manager, locale, "word", n)
+
+
+def _generate_sequential(dist, n, faker_manager, locale, table_data):
+    start = int(dist.get("start", 1))
+    step = int(dist.get("step", 1))
+    return np.arange(start, start + step * n, step, dtype=np.int64)
+
+
+def _parse_date_bound(value: Any):
+    """Resolve a Faker-style date bound ("-30d", "today", a date) with Faker's own parser."""
+    # _parse_date is private Faker API; fail loudly if an upgrade removes it
+    parse_date = getattr(DateTimeProvider, "_parse_date", None)
+    if parse_date is None:
+        raise RuntimeError(
+            "The installed Faker version no longer provides DateTimeProvider._parse_date, "
+            "which 'date' distributions use to resolve start_date/end_date"
+        )
+    return parse_date(value)
+
+
+def _generate_date(dist, n, faker_manager, locale, table_data):
+    # Resolve Faker-style bounds ("-30d", "today", ...) once, then draw all day offsets at once
+    start = np.datetime64(_parse_date_bound(dist.get("start_date", "-30d")), "D")
+    end = np.datetime64(_parse_date_bound(dist.get("end_date", "today")), "D")
+    span = int((end - start).astype(np.int64))
+    offsets = get_rng().integers(0, span + 1, size=n)
+    # datetime.date objects, as Faker returned: Parquet keeps date32 and CSV/JSON keep YYYY-MM-DD
+    return (start + offsets.astype("timedelta64[D]")).astype(object)
+
+
+def _generate_integer(dist, n, faker_manager, locale, table_data):
+    if dist.get("type") == "uniform":
+        low = int(dist.get("min", 0))
+        high = int(dist.get("max", 100))
+        return get_rng().integers(low, high + 1, size=n)
+    mean = float(dist.get("mean", 50))
+    std = float(dist.get("stddev", 10))
+    mn = int(dist.get("min", -10**9))
+    mx = int(dist.get("max", 10**9))
+    # Scale, round and clip in place in one float buffer, then cast once
+    buf = get_rng().standard_normal(n)
+    buf *= std
+    buf += mean
+    np.round(buf, out=buf)
+    np.clip(buf, mn, mx, out=buf)
+    return buf.astype(np.int64)
+
+
+def _generate_float(dist, n, faker_manager, locale, table_data):
+    mean = float(dist.get("mean", 50.0))
+    std = float(dist.get("stddev", 10.0))
+    mn = float(dist.get("min", -1e9))
+    mx = float(dist.get("max", 1e9))
+    buf = get_rng().standard_normal(n)
+    buf *= std
+    buf += mean
+    return np.clip(buf, mn, mx, out=buf)
+
+
+def _generate_boolean(dist, n, faker_manager, locale, table_data):
+    probs = dist.get("probabilities", [0.5, 0.5])
+    return get_rng().choice([True, False], size=n, p=probs)
+
+
+def _generate_word(dist, n, faker_manager, locale, table_data):
+    return _faker_values(faker_manager, locale, "word", n)
+
+
+# Generators selected by distribution type
+_DISTRIBUTION_GENERATORS: Dict[str, Callable] = {
+    "name": _generate_name,
+    "name_male": _generate_gendered_name("name_male"),
+    "name_female": _generate_gendered_name("name_female"),
+    "custom_format": _generate_custom_format,
+    "categorical": _generate_categorical,
+    "sequential": _generate_sequential,
+    "date": _generate_date,
+}
+
+# Generators selected by column type when the distribution doesn't pick one
+_TYPE_GENERATORS: Dict[str, Callable] = {
+    "integer": _generate_integer,
+    "float": _generate_float,
+    "boolean": _generate_boolean,
+}
+
+
+def _resolve_generator(column_def: Dict[str, Any], ctype: str, dist: Dict[str, Any], dtype: str | None) -> Callable:
+    # Name-like columns and patterns take precedence over the declared distribution
+    if dtype == "name" or column_def.get("name", "").lower() in ("name", "fullname"):
+        return _generate_name
+    if dtype not in ("name_male", "name_female") and dist.get("pattern"):
+        return _generate_custom_format
+
+    generator = _DISTRIBUTION_GENERATORS.get(dtype)
+    if generator is not None:
+        return generator
+    if dtype in ("normal", "uniform", None):
+        return _generate_integer
+    return _TYPE_GENERATORS.get(ctype, _generate_word)
+
+
+def generate_column(
+    column_def: Dict[str, Any],
+    n: int,
+    faker_manager: FakerManager,
+    table_locale: str | None,
+    table_data: Mapping[str, Any] | None = None,
+) -> List[Any] | np.ndarray:
     """
     Generate a column of synthetic values for a given column definition.
     Supports base types and distributions for scenario-aware data generation.
@@ -18,79 +215,14 @@ def generate_column(column_def: Dict[str, Any], n: int, faker_manager: FakerMana
     Args:
         faker_manager: The FakerManager to get locale-specific instances.
         table_locale: The locale specified for the table, if any.
+        table_data: Columns already generated for this table, if any.
     """
     ctype = column_def.get("type", "string")
     dist = column_def.get("distribution", {}) or {}
     dtype = dist.get("type")
 
     # Determine the correct locale: column > table > global default
-    column_locale = dist.get("locale")
-    faker_instance = faker_manager.get_instance(column_locale or table_locale)
+    locale = dist.get("locale") or table_locale
 
-    # 1. Name or ID-like fields
-    if dtype == "name" or column_def.get("name", "").lower() in ("name", "fullname"):
-        return [faker_instance.name() for _ in range(n)]
-    if dtype == "name_male":
-        return [faker_instance.name_male() for _ in range(n)]
-    if dtype == "name_female":
-        return [faker_instance.name_female() for _ in range(n)]
-
-    # 2. Custom formatted strings (like EMP####)
-    if dtype == "custom_format" or dist.get("pattern"):
-        pattern = dist.get("pattern") or ""
-        results = []
-        for _ in range(n):
-            s = "".join(str(random.randint(0, 9)) if ch == "#" else ch for ch in pattern)
-            results.append(s)
-        return results
-
-    # 3. Categorical values
-    if dtype == "categorical":
-        values = dist.get("values", [])
-        probs = dist.get("probabilities")
-        if values:
-            return list(np.random.choice(values, size=n, p=probs))
-        return [faker_instance.word() for _ in range(n)]
-
-    # 4. Sequential IDs or ordered values
-    if dtype == "sequential":
-        start = int(dist.get("start", 1))
-        step = int(dist.get("step", 1))
-        return list(range(start, start + step * n, step))
-
-    # 5. Dates / temporal data
-    if dtype == "date":
-        start_date = dist.get("start_date", "-30d")
-        end_date = dist.get("end_date", "today")
-        return [faker_instance.date_between(start_date=start_date, end_date=end_date) for _ in range(n)]
-
-    # 6. Integer distributions (normal or uniform)
-    if ctype == "integer" or dtype in ("normal", "uniform", None):
-        if dtype == "uniform":
-            low = int(dist.get("min", 0))
-            high = int(dist.get("max", 100))
-            return np.random.randint(low, high + 1, size=n).tolist()
-        else:
-            mean = float(dist.get("mean", 50))
-            std = float(dist.get("stddev", 10))
-            arr = np.random.normal(loc=mean, scale=std, size=n).round().astype(int).tolist()
-            mn = int(dist.get("min", -10**9))
-            mx = int(dist.get("max", 10**9))
-            return [max(mn, min(mx, int(x))) for x in arr]
-
-    # 7. Floating-point distributions
-    if ctype == "float":
-        mean = float(dist.get("mean", 50.0))
-        std = float(dist.get("stddev", 10.0))
-        arr = np.random.normal(loc=mean, scale=std, size=n).tolist()
-        mn = float(dist.get("min", -1e9))
-        mx = float(dist.get("max", 1e9))
-        return [max(mn, min(mx, float(x))) for x in arr]
-
-    # 8. Boolean fields
-    if ctype == "boolean":
-        probs = dist.get("probabilities", [0.5, 0.5])
-        return list(np.random.choice([True, False], size=n, p=probs))
-
-    # 9. Fallback: generic strings
-    return [faker_instance.word() for _ in range(n)]
+    generator = _resolve_generator(column_def, ctype, dist, dtype)
+    return generator(dist, n, faker_manager, locale, table_data)
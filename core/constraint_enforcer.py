@@ -1,6 +1,31 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
 import re
+from functools import lru_cache
 from typing import Dict, List, Any
+from ._frames import copy_frame
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern)
+
+
+def _regex_match(series: pd.Series, pattern: str) -> np.ndarray:
+    """Boolean mask of values matching pattern, using Arrow's vectorized regex kernel."""
+    compiled = _compile_pattern(pattern)
+    try:
+        mask = series.astype("string[pyarrow]").str.match(compiled, na=False).to_numpy(dtype=bool)
+    except pa.ArrowInvalid:
+        # Pattern uses syntax Arrow's RE2 engine doesn't support
+        mask = series.astype("string").str.match(compiled, na=False).to_numpy(dtype=bool)
+    nulls = series.isna().to_numpy()
+    if nulls.any():
+        # Missing values are matched as their str() form ("None", "nan", "NaT"), like astype(str)
+        mask[nulls] = series[nulls].astype(str).str.match(compiled).to_numpy(dtype=bool)
+    return mask
+
 
 def enforce_constraints(df: pd.DataFrame, constraints: List[Dict[str, Any]]) -> pd.DataFrame:
     """
@@ -18,7 +43,9 @@ def enforce_constraints(df: pd.DataFrame, constraints: List[Dict[str, Any]]) ->
     if df is None or not isinstance(df, pd.DataFrame) or not constraints:
         return df
 
-    df = df.copy()
+    df = copy_frame(df)
+    # Row filters only narrow this mask; the frame is sliced once at the end
+    keep = np.ones(len(df), dtype=bool)
 
     for c in constraints:
         ctype = c.get("type")
@@ -39,27 +66,28 @@ def enforce_constraints(df: pd.DataFrame, constraints: List[Dict[str, Any]]) ->
         elif ctype == "categorical":
             allowed = c.get("values", [])
             if allowed:
-                df = df[df[col].isin(allowed)]
+                keep &= df[col].isin(allowed).to_numpy()
 
         # 3. Nullability constraint
         elif ctype == "nullability":
             allow_null = c.get("nullable", True)
             if not allow_null:
-                df = df[df[col].notnull()]
+                keep &= df[col].notnull().to_numpy()
 
         # 4. Regex pattern enforcement
         elif ctype == "regex":
             pattern = c.get("pattern")
             if pattern:
-                df = df[df[col].astype(str).str.match(pattern, na=False)]
+                keep &= _regex_match(df[col], pattern)
 
         # 5. Uniqueness constraint
         elif ctype == "unique":
-            df = df.drop_duplicates(subset=[col])
+            # Only rows that survived earlier constraints compete for uniqueness
+            keep[keep] = ~df.loc[keep, col].duplicated().to_numpy()
 
         # 6. Custom inter-table / graph constraints (placeholder)
         elif ctype == "graph_relation":
             # Placeholder: apply external validation at post-generation stage
             pass
 
-    return df.reset_index(drop=True)
+    return df[keep].reset_index(drop=True)
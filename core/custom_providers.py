@@ -1,4 +1,6 @@
+import numpy as np
 from faker.providers import BaseProvider
+from ._rng import get_rng
 
 
 class TransliteratedArabicProvider(BaseProvider):
@@ -34,6 +36,29 @@ class TransliteratedArabicProvider(BaseProvider):
         'Ishaq', 'Jradi', 'Kanaan', 'Lutfi', 'Malek', 'Nimer', 'Obaid', 'Qasem'
     )
 
+    # Array views of the name tuples for bulk sampling
+    first_names_male_np = np.array(first_names_male)
+    first_names_female_np = np.array(first_names_female)
+    last_names_np = np.array(last_names)
+
+    def _names_bulk(self, first_names: np.ndarray, n: int) -> np.ndarray:
+        rng = get_rng()
+        first = rng.choice(first_names, size=n)
+        last = rng.choice(self.last_names_np, size=n)
+        return np.char.add(np.char.add(first, " "), last)
+
+    def name_male_bulk(self, n: int) -> np.ndarray:
+        """
+        Returns n transliterated male names in one vectorized draw.
+        """
+        return self._names_bulk(self.first_names_male_np, n)
+
+    def name_female_bulk(self, n: int) -> np.ndarray:
+        """
+        Returns n transliterated female names in one vectorized draw.
+        """
+        return self._names_bulk(self.first_names_female_np, n)
+
     def name_male(self) -> str:
         """
         Returns a transliterated male name.
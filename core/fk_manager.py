@@ -1,14 +1,40 @@
+import numpy as np
 import pandas as pd
-import random
-from typing import Optional, Dict, Callable, Any
+import warnings
+from typing import Optional, Dict, Callable, Any, Union
+from ._rng import get_rng
+from ._frames import copy_frame
+
+
+def _callable_mask(condition: Callable, child_df: pd.DataFrame) -> np.ndarray:
+    """
+    Evaluate a callable condition as a vectorized boolean mask.
+    Falls back to the legacy per-row contract (with a DeprecationWarning) when the
+    callable can't be applied to the whole frame.
+    """
+    try:
+        mask = np.asarray(condition(child_df), dtype=bool)
+        if mask.shape == (len(child_df),):
+            return mask
+    except Exception:
+        pass
+    warnings.warn(
+        "Row-wise callables for assign_foreign_key(condition=...) are deprecated; "
+        "pass a callable that takes the DataFrame and returns a boolean mask.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+    return child_df.apply(condition, axis=1).to_numpy(dtype=bool)
+
 
 def assign_foreign_key(
     child_df: pd.DataFrame,
     child_col: str,
     parent_df: pd.DataFrame,
     parent_col: str,
-    condition: Optional[Dict[str, Any]] = None,
-    seed: Optional[int] = None
+    condition: Optional[Union[Dict[str, Any], Callable[[pd.DataFrame], Any], pd.Series, np.ndarray]] = None,
+    seed: Optional[int] = None,
+    parent_ids_array: Optional[np.ndarray] = None
 ) -> pd.DataFrame:
     """
     Assign values to child_df[child_col] sampled from parent_df[parent_col].
@@ -18,47 +44,63 @@ def assign_foreign_key(
         child_col: Column in child_df where foreign key values will be assigned.
         parent_df: The parent table DataFrame.
         parent_col: Column in parent_df containing unique key values.
-        condition: Optional dict or callable to control selective assignment.
+        condition: Optional dict, boolean mask or callable to control selective assignment.
             Example dict: {"col": "isActive", "value": True}
-            Example callable: lambda row: row["age"] > 18
-        seed: Optional integer for deterministic randomization.
+            Example mask: child_df["age"] > 18
+            Example callable: lambda df: df["age"] > 18
+            Callables receive the whole DataFrame and return a boolean mask; per-row
+            callables are still accepted but deprecated.
+        seed: Optional integer for deterministic randomization; pass it for reproducible output.
+            Never touches the global random / np.random state.
+        parent_ids_array: Optional precomputed unique, non-null parent keys
+            (e.g. cached across several child columns referencing the same parent).
 
     Returns:
         Updated child DataFrame with the foreign key column populated.
     """
-    if seed is not None:
-        random.seed(seed)
+    # Seeded calls get their own generator; otherwise share the thread's generator
+    rng = np.random.default_rng(seed) if seed is not None else get_rng()
 
-    if parent_df is None or parent_col not in parent_df.columns:
+    if parent_ids_array is not None:
+        parent_ids = parent_ids_array
+    elif parent_df is None or parent_col not in parent_df.columns:
         raise ValueError("Parent data must contain parent_col")
-
-    parent_ids = parent_df[parent_col].dropna().unique().tolist()
+    else:
+        parent_ids = np.asarray(parent_df[parent_col].dropna().unique())
     if len(parent_ids) == 0:
         raise ValueError("No parent keys to sample from")
 
-    child_df = child_df.copy()
+    child_df = copy_frame(child_df)
 
     # If no condition → assign randomly to all rows
     if condition is None:
-        child_df[child_col] = random.choices(parent_ids, k=len(child_df))
+        child_df[child_col] = rng.choice(parent_ids, size=len(child_df))
         return child_df
 
-    # If condition is callable
-    if callable(condition):
-        mask = child_df.apply(condition, axis=1)
-        child_df.loc[mask, child_col] = random.choices(parent_ids, k=mask.sum())
-        child_df.loc[~mask, child_col] = None
-        return child_df
+    # Boolean masks are used as-is
+    if isinstance(condition, (pd.Series, np.ndarray)):
+        mask = np.asarray(condition, dtype=bool)
+
+    # If condition is callable (evaluated on the whole frame)
+    elif callable(condition):
+        mask = _callable_mask(condition, child_df)
 
     # If condition is dict
-    cond_col = condition.get("col")
-    cond_val = condition.get("value")
+    else:
+        cond_col = condition.get("col")
+        cond_val = condition.get("value")
+
+        if cond_col is None:
+            raise ValueError("Condition dict must have a 'col' key")
 
-    if cond_col is None:
-        raise ValueError("Condition dict must have a 'col' key")
+        values = child_df[cond_col].to_numpy()
+        if values.dtype.kind in "biuf":
+            # Plain numeric/bool columns: compare the ndarray directly, skipping Series alignment
+            mask = values == cond_val
+        else:
+            mask = (child_df[cond_col] == cond_val).to_numpy()
 
-    mask = child_df[cond_col] == cond_val
-    child_df.loc[mask, child_col] = random.choices(parent_ids, k=mask.sum())
+    child_df.loc[mask, child_col] = rng.choice(parent_ids, size=int(mask.sum()))
     child_df.loc[~mask, child_col] = None
 
     return child_df
@@ -1,14 +1,32 @@
 import os
+import copy
 import json
 import pickle
+from functools import lru_cache
 import networkx as nx
+from ._json_io import json_load
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional; only needed for .msgpack graphs
+    msgpack = None
+
+
+def _node_link_to_graph(data, **kwargs):
+    edge_key = "edges" if "edges" in data else "links"
+    return nx.node_link_graph(data, edges=edge_key, **kwargs)
 
 
 def _load_from_json(path):
-    with open(path, "r") as f:
-        data = json.load(f)
-        edge_key = "edges" if "edges" in data else "links"
-        return nx.node_link_graph(data, edges=edge_key)
+    with open(path, "rb") as f:
+        return _node_link_to_graph(json_load(f))
+
+
+def _load_from_msgpack(path):
+    if msgpack is None:
+        raise ImportError("Loading .msgpack graphs requires the 'msgpack' package")
+    with open(path, "rb") as f:
+        return _node_link_to_graph(msgpack.unpackb(f.read(), raw=False))
 
 
 def _load_from_gpickle(path):
@@ -19,12 +37,13 @@ def _load_from_gpickle(path):
 def load_graph(graph_path):
     """
     Dynamically load a graph from supported formats.
-    Supported: .graphml, .json (node-link), .gpickle/.pkl
+    Supported: .graphml, .json / .msgpack (node-link), .gpickle/.pkl
     """
     ext = os.path.splitext(graph_path)[1].lower()
     loaders = {
             ".graphml": nx.read_graphml,
             ".json": _load_from_json,
+            ".msgpack": _load_from_msgpack,
             ".gpickle": _load_from_gpickle,
             ".pkl": _load_from_gpickle,
         }
@@ -40,116 +59,96 @@ def load_ecore_model(path):
     """
     if not path or not os.path.exists(path):
         return {}
-    with open(path, "r") as f:
-        return json.load(f)
-
-
-def parse_graph(graph_path):
-    """
-    Parse a scenario graph into a working schema compatible with the generation pipeline.
-    Produces working_schema with 'tables' and 'edges'.
-    """
-    G = load_graph(graph_path)
-
-    tables = []
-    edges = []
+    with open(path, "rb") as f:
+        return json_load(f)
 
-    for node_id, attrs in G.nodes(data=True):
-        table_name = attrs.get("name", str(node_id))
-        row_count = attrs.get("row_count", 100)
-        locale = attrs.get("locale")
-        time_series_spec = attrs.get("time_series_spec")
 
+def _table_entry(node_id, attrs):
+    table_entry = {
+        "name": attrs.get("name", str(node_id)),
         # If columns defined in the graph, use them; otherwise add a default ID column
-        columns = attrs.get("columns", [{"name": "id", "type": "int"}])
-
+        "columns": attrs.get("columns", [{"name": "id", "type": "int"}]),
+        "rows": attrs.get("row_count", 100),
         # Capture dependencies (markov_blanket)
-        dependencies = attrs.get("markov_blanket", [])
-        # Capture top-level constraints for the table
-        constraints = attrs.get("constraints", [])
-        if "constraints" in G.graph and G.graph["constraints"]:
-            constraints.extend([c for c in G.graph["constraints"] if c.get("table") == table_name])
-
-        table_entry = {
-            "name": table_name,
-            "columns": columns,
-            "rows": row_count,
-            "dependencies": dependencies,
-        }
-        if locale:
-            table_entry["locale"] = locale
-        if time_series_spec:
-            table_entry["time_series_spec"] = time_series_spec
-
-        tables.append(table_entry)
-
-    for u, v, edge_data in G.edges(data=True):
-        edge_entry = {
-            "from": G.nodes[u].get("name", str(u)),
-            "to": G.nodes[v].get("name", str(v)),
-            "relation_type": edge_data.get("relation_type", "dependency"),
-            "constraints": edge_data.get("constraints", {}),
-        }
-        edges.append(edge_entry)
+        "dependencies": attrs.get("markov_blanket", []),
+    }
+    if attrs.get("locale"):
+        table_entry["locale"] = attrs["locale"]
+    if attrs.get("time_series_spec"):
+        table_entry["time_series_spec"] = attrs["time_series_spec"]
+    return table_entry
+
+
+def _edge_entry(G, u, v, edge_data):
+    return {
+        "from": G.nodes[u].get("name", str(u)),
+        "to": G.nodes[v].get("name", str(v)),
+        "relation_type": edge_data.get("relation_type", "dependency"),
+        "constraints": edge_data.get("constraints", {}),
+    }
+
 
+def _graph_to_working_schema(G):
+    """Convert a loaded scenario graph into a working schema with 'tables' and 'edges'."""
     working_schema = {
-        "tables": tables,
-        "edges": edges
+        "tables": [_table_entry(node_id, attrs) for node_id, attrs in G.nodes(data=True)],
+        "edges": [_edge_entry(G, u, v, edge_data) for u, v, edge_data in G.edges(data=True)],
     }
 
+    # A directed acyclic graph already encodes the generation order; record it so the
+    # generator doesn't have to rebuild a dependency DAG
+    if G.is_directed() and nx.is_directed_acyclic_graph(G):
+        name_of = {node_id: attrs.get("name", str(node_id)) for node_id, attrs in G.nodes(data=True)}
+        working_schema["_topo_order"] = [name_of[n] for n in nx.topological_sort(G)]
+
     return working_schema
 
+
+def clone_schema(schema):
+    """
+    Deep-copy a working schema. Schemas are nested dicts/lists of JSON scalars, so a plain
+    recursive copy is enough and avoids copy.deepcopy's memo bookkeeping.
+    Anything else (tuples, sets, custom objects) is handed to copy.deepcopy.
+    """
+    if isinstance(schema, dict):
+        return {k: clone_schema(v) for k, v in schema.items()}
+    if isinstance(schema, list):
+        return [clone_schema(v) for v in schema]
+    if schema is None or isinstance(schema, (str, int, float, bool)):
+        return schema
+    return copy.deepcopy(schema)
+
+
+def parse_graph(graph_path=None, *, graph_data=None):
+    """
+    Parse a scenario graph into a working schema compatible with the generation pipeline.
+    Produces working_schema with 'tables' and 'edges'.
+    The graph is read from graph_path, or taken from an already-decoded node-link dict (graph_data).
+    Parsed files are cached per (path, mtime, size), so editing the file invalidates the entry;
+    callers get their own deep copy and may mutate it freely.
+    """
+    if graph_data is not None:
+        return parse_graph_from_dict(graph_data)
+    if graph_path is None:
+        raise ValueError("Either graph_path or graph_data must be provided")
+    stat = os.stat(graph_path)
+    return clone_schema(_parse_graph_cached(graph_path, stat.st_mtime_ns, stat.st_size))
+
+
+@lru_cache(maxsize=32)
+def _parse_graph_cached(graph_path, mtime_ns, size):
+    """Parse graph_path; mtime_ns and size only serve as part of the cache key."""
+    return _graph_to_working_schema(load_graph(graph_path))
+
+
 def parse_graph_from_dict(graph_dict: dict) -> dict:
     """
     Parse a scenario graph from a dictionary into a working schema.
     This is used for API-based generation where the graph is in the request body.
     """
-    edge_key = "edges" if "edges" in graph_dict else "links"
     # Use networkx to interpret the node-link structure, supporting 'edges' or 'links'
     # The 'attrs' argument is not supported by node_link_graph, attributes are read directly from node/edge dicts.
-    G = nx.node_link_graph(graph_dict, directed=True, multigraph=False, edges=edge_key)
-
-    tables = []
-    edges = []
-
-    for node_id, attrs in G.nodes(data=True):
-        table_name = attrs.get("name", str(node_id))
-        row_count = attrs.get("row_count", 100)
-        locale = attrs.get("locale")
-        time_series_spec = attrs.get("time_series_spec")
-
-        columns = attrs.get("columns", [{"name": "id", "type": "int"}])
-        dependencies = attrs.get("markov_blanket", [])
-        constraints = attrs.get("constraints", [])
-        if "constraints" in G.graph and G.graph["constraints"]:
-            constraints.extend([c for c in G.graph["constraints"] if c.get("table") == table_name])
-
-        table_entry = {
-            "name": table_name,
-            "columns": columns,
-            "rows": row_count,
-            "dependencies": dependencies,
-        }
-        if locale:
-            table_entry["locale"] = locale
-        if time_series_spec:
-            table_entry["time_series_spec"] = time_series_spec
-
-        tables.append(table_entry)
-
-    for u, v, edge_data in G.edges(data=True):
-        edge_entry = {
-            "from": G.nodes[u].get("name", str(u)),
-            "to": G.nodes[v].get("name", str(v)),
-            "relation_type": edge_data.get("relation_type", "dependency"),
-            "constraints": edge_data.get("constraints", {}),
-        }
-        edges.append(edge_entry)
-
-    return {"tables": tables, "edges": edges}
-
-
-
+    return _graph_to_working_schema(_node_link_to_graph(graph_dict, directed=True, multigraph=False))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 def post_generation_validate(all_tables: Dict[str, pd.DataFrame], spec: Dict) -> Dict[str, pd.DataFrame]:
     """
@@ -13,39 +14,78 @@ def post_generation_validate(all_tables: Dict[str, pd.DataFrame], spec: Dict) ->
     if not spec or 'tables' not in spec:
         return all_tables
 
+    # Valid keys per referenced (parent table, column), built once and shared by every child column
+    valid_keys: Dict[Tuple[str, str], pd.Index] = {}
+
+    # Pre-scan the spec: only columns with an FK, unique or not-null rule need validating,
+    # and tables without any such column are skipped entirely
+    to_validate = []
     for table in spec['tables']:
-        tname = table['name']
+        columns = [col for col in table.get('columns', [])
+                   if col.get('foreign_key') or col.get('unique', False) or not col.get('nullable', True)]
+        if columns:
+            to_validate.append((table['name'], columns))
+
+    for tname, columns in to_validate:
         df = all_tables.get(tname)
         if df is None or not isinstance(df, pd.DataFrame):
             continue
 
-        # --- Foreign Key Validation ---
-        for col in table.get('columns', []):
+        # Collect all checks in one sweep of the columns, then apply each kind once
+        fk_invalid: List[Tuple[str, np.ndarray]] = []
+        unique_cols: List[str] = []
+        notnull_cols: List[str] = []
+        for col in columns:
+            cname = col['name']
+            if cname not in df.columns:
+                continue
+
+            # --- Foreign Key Validation ---
             fk = col.get('foreign_key')
             if fk:
                 parent_name = fk.get('table')
                 parent_col = fk.get('column')
                 parent_df = all_tables.get(parent_name)
                 if parent_df is not None and parent_col in parent_df.columns:
-                    valid_set = set(parent_df[parent_col].dropna().unique().tolist())
-                    invalid_mask = ~df[col['name']].isin(valid_set)
+                    key = (parent_name, parent_col)
+                    valid_index = valid_keys.get(key)
+                    if valid_index is None:
+                        # pd.Index.isin probes a hashtable built in C instead of a Python set
+                        valid_index = valid_keys[key] = pd.Index(parent_df[parent_col].dropna().unique())
+                    invalid_mask = ~df[cname].isin(valid_index).to_numpy()
                     if invalid_mask.any():
-                        # Invalidate wrong FKs
-                        df.loc[invalid_mask, col['name']] = None
-                all_tables[tname] = df
+                        fk_invalid.append((cname, invalid_mask))
+
+            if col.get('unique', False):
+                unique_cols.append(cname)
+            if not col.get('nullable', True):
+                notnull_cols.append(cname)
+
+        # Invalidate wrong FKs
+        for cname, invalid_mask in fk_invalid:
+            df.loc[invalid_mask, cname] = None
+
+        # Row filters only narrow this mask; the frame is sliced once at the end
+        keep = np.ones(len(df), dtype=bool)
 
         # --- Uniqueness Validation ---
-        for col in table.get('columns', []):
-            if col.get('unique', False) and col['name'] in df.columns:
-                # Drop duplicates keeping first occurrence
-                df = df.drop_duplicates(subset=[col['name']])
-                all_tables[tname] = df
+        # Each unique column is deduplicated on its own, keeping first occurrences
+        # among the rows that survived earlier columns
+        for cname in unique_cols:
+            keep[keep] = ~df.loc[keep, cname].duplicated().to_numpy()
 
         # --- Nullability / Total Participation ---
-        for col in table.get('columns', []):
-            nullable = col.get('nullable', True)
-            if not nullable and col['name'] in df.columns:
-                df = df[df[col['name']].notnull()]
-                all_tables[tname] = df
+        if notnull_cols:
+            keep &= df[notnull_cols].notna().all(axis=1).to_numpy()
+
+        if not keep.all():
+            df = df[keep]
+
+        if fk_invalid or len(df) < len(keep):
+            # This table's keys changed; children validated later must see the current rows
+            for key in [k for k in valid_keys if k[0] == tname]:
+                del valid_keys[key]
+
+        all_tables[tname] = df
 
     return all_tables
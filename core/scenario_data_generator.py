@@ -1,7 +1,46 @@
+import os
+import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
 from ._faker_manager import FakerManager
+from ._frames import copy_frame
+
+logger = logging.getLogger(__name__)
+
+
+def _generate_table(table_spec: Dict[str, Any], faker_manager: FakerManager) -> pd.DataFrame:
+    """Generate, constrain and time-index a single table (steps 1-2.5 of generate_scenario_data)."""
+    from core.column_generator import generate_column
+    from core.constraint_enforcer import enforce_constraints
+    from core.temporal_data_generator import generate_time_series_for_table
+
+    table_name = table_spec["name"]
+    # Determine the locale for this table, falling back to the global default
+    table_locale = table_spec.get("locale")
+    if table_locale:
+        logger.info("Using table-specific locale '%s' for table '%s'", table_locale, table_name)
+
+    n = int(table_spec.get("rows", 100))
+    # Collect the columns first and build the frame once, instead of growing it column by column
+    col_data: Dict[str, Any] = {}
+    for col_def in table_spec.get("columns", []):
+        col_name = col_def["name"]
+        col_data[col_name] = generate_column(col_def, n, faker_manager, table_locale, col_data)
+    df = pd.DataFrame(col_data, copy=False)
+
+    # Step 2: Enforce constraints
+    constraints = table_spec.get("constraints", [])
+    df = enforce_constraints(df, constraints)
+
+    # Step 2.5: Generate time-series data if specified
+    time_series_spec = table_spec.get("time_series_spec")
+    if time_series_spec:
+        df = generate_time_series_for_table(df, time_series_spec)
+    logger.debug("After initial generation for %s: %d rows", table_name, len(df))
+    return df
+
 
 # -------------------------------
 # Scenario Transformer
@@ -19,11 +58,8 @@ def generate_scenario_data(working_schema: Dict[str, Any]) -> Dict[str, pd.DataF
         5. Apply SCM/causal generation.
     """
     from core.dependency_analyzer import analyze_dependencies
-    from core.column_generator import generate_column
-    from core.constraint_enforcer import enforce_constraints
     from core.custom_providers import TransliteratedArabicProvider
     from core.fk_manager import assign_foreign_key
-    from core.temporal_data_generator import generate_time_series_for_table
     from core.causal_data_generator import generate_causal_by_scm
 
     # ---------------------------
@@ -39,51 +75,39 @@ def generate_scenario_data(working_schema: Dict[str, Any]) -> Dict[str, pd.DataF
     else:
         raise KeyError("Schema must contain either 'tables' or 'nodes'.")
 
-    print(f"[INFO] Detected schema type: {schema_type}")
+    logger.info("Detected schema type: %s", schema_type)
+    table_by_name = {t["name"]: t for t in table_list}
 
     tables_data = {}
-    dependencies, _ = analyze_dependencies(working_schema) # Correctly unpack the tuple
+    # Prefer the order precomputed by the graph parser when it covers exactly these tables
+    topo_order = working_schema.get("_topo_order")
+    if topo_order is not None and len(topo_order) == len(table_by_name) and set(topo_order) == set(table_by_name):
+        dependencies = topo_order
+        logger.debug("Using precomputed dependency order: %s", dependencies)
+    else:
+        dependencies, _ = analyze_dependencies(working_schema) # Correctly unpack the tuple
     
     # Initialize a FakerManager to handle locale management efficiently
     global_locale = working_schema.get("metadata", {}).get("default_locale", "en_US")
     faker_manager = FakerManager(global_locale)
     faker_manager.add_provider_for_locale("ar_PS", TransliteratedArabicProvider)
-    print(f"  [INFO] Using global default locale '{global_locale}'")
-
-    # Step 1: Generate base columns for each table in dependency order
-    for table_name in dependencies:
-        table_spec = next((t for t in table_list if t["name"] == table_name), None)
-        if table_spec is None:
-            continue
-        
-        # Determine the locale for this table, falling back to the global default
-        table_locale = table_spec.get("locale")
-        if table_locale:
-            print(f"  [INFO] Using table-specific locale '{table_locale}' for table '{table_name}'")
-        
-        n = int(table_spec.get("rows", 100))
-        df = pd.DataFrame()
-
-        for col_def in table_spec.get("columns", []):
-            col_name = col_def["name"]
-            df[col_name] = generate_column(col_def, n, faker_manager, table_locale)
-
-        # Step 2: Enforce constraints
-        constraints = table_spec.get("constraints", [])
-        df = enforce_constraints(df, constraints)
-
-        tables_data[table_name] = df
-
-        # Step 2.5: Generate time-series data if specified
-        time_series_spec = table_spec.get("time_series_spec")
-        if time_series_spec:
-            df = generate_time_series_for_table(df, time_series_spec)
-            tables_data[table_name] = df
-        print(f"  [DEBUG] After initial generation for {table_name}: {len(df)} rows")
+    logger.info("Using global default locale '%s'", global_locale)
+
+    # Step 1: Generate base columns for each table
+    # Tables only read their own columns here (FKs are assigned in step 3), so they are generated concurrently
+    specs = [table_by_name[table_name] for table_name in dependencies if table_name in table_by_name]
+    if len(specs) > 1:
+        with ThreadPoolExecutor(max_workers=min(len(specs), os.cpu_count() or 1)) as pool:
+            frames = list(pool.map(lambda spec: _generate_table(spec, faker_manager), specs))
+    else:
+        frames = [_generate_table(spec, faker_manager) for spec in specs]
+    for table_spec, df in zip(specs, frames):
+        tables_data[table_spec["name"]] = df
 
     # Step 3: Assign foreign keys
-    for table_spec in table_list:
-        tname = table_spec["name"]
+    # Parent key arrays are extracted once per (parent table, column), however many children reference them
+    parent_keys_cache: Dict[Tuple[str, str], np.ndarray] = {}
+    for tname, table_spec in table_by_name.items():
         df = tables_data.get(tname)
         if df is None:
             continue
@@ -95,14 +119,17 @@ def generate_scenario_data(working_schema: Dict[str, Any]) -> Dict[str, pd.DataF
                 parent_col = fk.get("column")
                 parent_df = tables_data.get(parent_name)
                 if parent_df is not None:
-                    df = assign_foreign_key(df, col["name"], parent_df, parent_col)
+                    key = (parent_name, parent_col)
+                    if key not in parent_keys_cache and parent_col in parent_df.columns:
+                        parent_keys_cache[key] = np.asarray(parent_df[parent_col].dropna().unique())
+                    df = assign_foreign_key(df, col["name"], parent_df, parent_col,
+                                            parent_ids_array=parent_keys_cache.get(key))
 
         tables_data[tname] = df
-        print(f"  [DEBUG] After FK assignment for {tname}: {len(df)} rows")
+        logger.debug("After FK assignment for %s: %d rows", tname, len(df))
 
     # Step 4: Apply causal models (if present)
-    for table_spec in table_list:
-        tname = table_spec["name"]
+    for tname, table_spec in table_by_name.items():
         df = tables_data.get(tname)
         if df is None:
             continue
@@ -110,7 +137,7 @@ def generate_scenario_data(working_schema: Dict[str, Any]) -> Dict[str, pd.DataF
         if scm_spec:
             df = generate_causal_by_scm(df, scm_spec)
         tables_data[tname] = df
-        print(f"  [DEBUG] After SCM for {tname}: {len(df)} rows")
+        logger.debug("After SCM for %s: %d rows", tname, len(df))
 
     return tables_data
 
@@ -121,7 +148,7 @@ def apply_scenario(df: pd.DataFrame, scenario: Dict[str, Any]) -> pd.DataFrame:
     Example:
         {"type": "inflation", "field": "price", "multiplier": 1.1}
     """
-    df = df.copy()
+    df = copy_frame(df)
     stype = scenario.get("type")
 
     if stype == "inflation":
@@ -1,6 +1,27 @@
 import json
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from typing import Dict, Any, Tuple
+from ._json_io import json_load, JSONDecodeError
+
+# Compiled validators keyed by the canonical JSON of their schema
+_validators: Dict[str, Any] = {}
+
+
+def _get_validator(schema: Dict[str, Any]) -> Any:
+    """
+    Return a validator for schema, checking and building it only once per distinct schema.
+    jsonschema.validate() re-checks the schema and rebuilds the validator on every call.
+    """
+    key = json.dumps(schema, sort_keys=True, default=str)
+    validator = _validators.get(key)
+    if validator is None:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        validator = _validators[key] = cls(schema)
+    return validator
+
 
 def _validate_spec_dicts(spec: Dict[str, Any], schema: Dict[str, Any]) -> Tuple[bool, str]:
     """
@@ -8,7 +29,10 @@ def _validate_spec_dicts(spec: Dict[str, Any], schema: Dict[str, Any]) -> Tuple[
     Returns (True, "") on success, (False, error_message) on failure.
     """
     try:
-        validate(instance=spec, schema=schema)
+        # Same error selection as jsonschema.validate()
+        error = best_match(_get_validator(schema).iter_errors(spec))
+        if error is not None:
+            raise error
         return True, ""
     except ValidationError as e:
         error_path = " -> ".join(map(str, e.path))
@@ -20,13 +44,13 @@ def validate_spec(spec_path: str, schema_path: str) -> Tuple[bool, Any]:
     Returns (True, spec_dict) on success, (False, error_message) on failure.
     """
     try:
-        with open(spec_path, 'r') as f:
-            spec = json.load(f)
-        with open(schema_path, 'r') as f:
-            schema = json.load(f)
+        with open(spec_path, 'rb') as f:
+            spec = json_load(f)
+        with open(schema_path, 'rb') as f:
+            schema = json_load(f)
     except FileNotFoundError as e:
         return False, f"File not found: {e.filename}"
-    except json.JSONDecodeError as e:
+    except JSONDecodeError as e:
         return False, f"Error decoding JSON in {e.doc.name if hasattr(e, 'doc') and hasattr(e.doc, 'name') else 'file'}: {e.msg} at line {e.lineno}, column {e.colno}"
 
     ok, error_message = _validate_spec_dicts(spec, schema)
@@ -1,6 +1,19 @@
+import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, Any
+from ._frames import copy_frame
+
+# Frequencies with a constant step, generated without pandas' DateOffset machinery
+_FIXED_FREQ_STEPS = {
+    "D": np.timedelta64(1, "D"),
+    "h": np.timedelta64(1, "h"), "H": np.timedelta64(1, "h"),
+    "min": np.timedelta64(1, "m"), "T": np.timedelta64(1, "m"),
+    "s": np.timedelta64(1, "s"), "S": np.timedelta64(1, "s"),
+    "ms": np.timedelta64(1, "ms"),
+    "us": np.timedelta64(1, "us"),
+    "ns": np.timedelta64(1, "ns"),
+}
 
 
 def generate_time_series_for_table(df: pd.DataFrame, time_spec: Dict[str, Any]) -> pd.DataFrame:
@@ -13,11 +26,16 @@ def generate_time_series_for_table(df: pd.DataFrame, time_spec: Dict[str, Any])
         "freq": "D"
     }
     """
-    df = df.copy()
+    df = copy_frame(df)
     n = len(df)
     start_str = time_spec.get("start", datetime.utcnow().isoformat())
     start = pd.to_datetime(start_str)
     freq = time_spec.get("freq", "D")  # 'H' for hour, 'D' for day, 'T' for minute
-    times = pd.date_range(start=start, periods=n, freq=freq)
+    step = _FIXED_FREQ_STEPS.get(freq)
+    if step is not None and start.tz is None:
+        # Fixed-width steps: one int64 arange instead of building a DatetimeIndex
+        times = start.as_unit("ns").to_datetime64() + np.arange(n, dtype=np.int64) * step
+    else:
+        times = pd.date_range(start=start, periods=n, freq=freq)
     df[time_spec.get("column", "timestamp")] = times
     return df
@@ -1,11 +1,28 @@
 import os
 import argparse
 import json
+import logging
+import pandas as pd
+from functools import lru_cache
+from core._json_io import json_loads, JSONDecodeError
 from core.graph_parser import parse_graph
 from core.scenario_data_generator import generate_scenario_data
 from core.post_validator import post_generation_validate
 from core.file_exporter import export_all_tables
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=64)
+def _parse_overrides(row_counts_override: str):
+    """Decode a --row-counts value; repeated strings are only parsed once. Callers must not mutate the result."""
+    return json_loads(row_counts_override)
+
+
+def _table_sizes(tables):
+    return [f"{name}:{len(df)}" for name, df in tables.items()]
+
+
 def generate_tables_from_graph(graph_path: str, output_dir: str, output_format: str = "json", row_counts_override: str = None, locale: str = "en_US"):
     # Parse the scenario graph into working schema
     working_schema = parse_graph(graph_path)
@@ -17,32 +34,35 @@ def generate_tables_from_graph(graph_path: str, output_dir: str, output_format:
     # Override row counts if provided
     if row_counts_override:
         try:
-            overrides = json.loads(row_counts_override) 
+            overrides = _parse_overrides(row_counts_override)
             if isinstance(overrides, dict):
-                # Apply specific overrides from a dictionary
-                for table in working_schema.get("tables", []):
-                    if table["name"] in overrides:
-                        table["rows"] = overrides[table["name"]]
-                        print(f"[INFO] Overriding row count for '{table['name']}' to {table['rows']}")
+                # Apply specific overrides from a dictionary (an empty one needs no table scan)
+                by_name = {t["name"]: t for t in working_schema.get("tables", [])} if overrides else {}
+                for name, rows in overrides.items():
+                    if name in by_name:
+                        by_name[name]["rows"] = rows
+                        logger.info("Overriding row count for '%s' to %s", name, rows)
             elif isinstance(overrides, int):
                 # Apply a single row count to all tables
-                print(f"[INFO] Overriding row count for all tables to {overrides}")
+                logger.info("Overriding row count for all tables to %s", overrides)
                 for table in working_schema.get("tables", []):
                     table["rows"] = overrides
             else:
-                print(f"[WARN] --row-counts must be a JSON dictionary or a single integer. Ignoring.")
-        except json.JSONDecodeError:
-            print(f"[WARN] Invalid JSON in --row-counts argument: {row_counts_override}")
+                logger.warning("--row-counts must be a JSON dictionary or a single integer. Ignoring.")
+        except JSONDecodeError:
+            logger.warning("Invalid JSON in --row-counts argument: %s", row_counts_override)
 
-    print(f"[DEBUG] Schema parsed. Tables found: {len(working_schema.get('tables', []))}")
+    logger.debug("Schema parsed. Tables found: %d", len(working_schema.get("tables", [])))
 
     # Generate data
     generated_tables = generate_scenario_data(working_schema)
-    print(f"[DEBUG] Data generated. Tables: {len(generated_tables)}. Sizes: {[f'{name}:{len(df)}' for name, df in generated_tables.items()] if generated_tables else 'No tables generated.'}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Data generated. Tables: %d. Sizes: %s", len(generated_tables), _table_sizes(generated_tables) or "No tables generated.")
 
     # Perform post-generation validation (FKs, uniqueness, etc.)
     generated_tables = post_generation_validate(generated_tables, working_schema)
-    print(f"[DEBUG] Post-validation complete. Tables: {len(generated_tables)}. Sizes: {[f'{name}:{len(df)}' for name, df in generated_tables.items()] if generated_tables else 'No tables after validation.'}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Post-validation complete. Tables: %d. Sizes: %s", len(generated_tables), _table_sizes(generated_tables) or "No tables after validation.")
 
 
     # Export all tables
@@ -51,6 +71,9 @@ def generate_tables_from_graph(graph_path: str, output_dir: str, output_format:
     return paths
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s")
+    # Let the core helpers copy frames lazily instead of deep-copying every table they touch
+    pd.set_option("mode.copy_on_write", True)
     parser = argparse.ArgumentParser()
     parser.add_argument("--graph", type=str, required=True, help="Path to input scenario graph")
     parser.add_argument("--out", type=str, default="data/output", help="Output folder")
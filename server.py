@@ -1,66 +1,147 @@
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel, Field
-from typing import Dict, Any, List, Optional
+import asyncio
+import hashlib
+import threading
+import orjson
 import pandas as pd
+from collections import OrderedDict
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.gzip import GZipMiddleware
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Dict, Any, Optional
 
 # core generation logic
-from core.graph_parser import parse_graph_from_dict
+from core.graph_parser import clone_schema, parse_graph_from_dict
 from core.scenario_data_generator import generate_scenario_data
 from core.post_validator import post_generation_validate
 
+# Let the core helpers copy frames lazily instead of deep-copying every table they touch
+pd.set_option("mode.copy_on_write", True)
+
 app = FastAPI(
     title="Synthetic Data Generator API",
     description="An API to generate complex, relational synthetic data from a graph definition.",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson encodes datetimes and numpy scalars natively, without a Python default= hook
+    default_response_class=ORJSONResponse,
 )
+# Generated tables are highly repetitive, so large JSON bodies compress well for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
 
 class GenerationOptions(BaseModel):
     """Defines the generation settings."""
-    row_counts: Optional[Dict[str, int]] = Field(None, description="Override row counts for specific tables.")
+    # Options are read-only once parsed; frozen models reject accidental mutation between pipeline stages
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    row_counts: Optional[dict[str, int]] = Field(None, description="Override row counts for specific tables.")
     locale: str = Field("en_US", description="Default locale for Faker data generation (e.g., 'en_US', 'fr_FR').")
 
 class GenerationRequest(BaseModel):
     """The request body for the data generation endpoint."""
-    nodes: List[Dict[str, Any]] = Field(..., description="List of nodes (tables) in the graph.")
-    edges: List[Dict[str, Any]] = Field([], description="List of edges (relationships) between nodes.")
-    constraints: Optional[List[Dict[str, Any]]] = Field(None, description="Global constraints for the graph.")
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+    nodes: list[dict[str, Any]] = Field(..., description="List of nodes (tables) in the graph.")
+    edges: list[dict[str, Any]] = Field([], description="List of edges (relationships) between nodes.")
+    constraints: Optional[list[dict[str, Any]]] = Field(None, description="Global constraints for the graph.")
     options: Optional[GenerationOptions] = Field(default_factory=GenerationOptions, description="Settings for data generation.")
 
 
-@app.post("/generate", response_model=Dict[str, List[Dict[str, Any]]])
+# Parsed schemas keyed by a BLAKE2b digest of the canonical graph JSON, least recently used first
+_SCHEMA_CACHE_SIZE = 128
+_schema_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+_schema_cache_lock = threading.Lock()
+
+
+def _parse_graph_cached(graph_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Parse a graph once per distinct body. Only the 16-byte digest is kept as the key, not the body.
+    The returned schema is shared; callers must copy it before mutating.
+    """
+    key = hashlib.blake2b(orjson.dumps(graph_dict, option=orjson.OPT_SORT_KEYS), digest_size=16).digest()
+    with _schema_cache_lock:
+        schema = _schema_cache.get(key)
+        if schema is not None:
+            _schema_cache.move_to_end(key)
+            return schema
+
+    schema = parse_graph_from_dict(graph_dict)
+    with _schema_cache_lock:
+        _schema_cache[key] = schema
+        if len(_schema_cache) > _SCHEMA_CACHE_SIZE:
+            _schema_cache.popitem(last=False)
+    return schema
+
+
+def _format_datetime_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Render datetime64 columns in datetime.isoformat() form, as the response has always carried them.
+    Missing values stay null.
+    """
+    for cname in df.columns:
+        values = df[cname]
+        if not pd.api.types.is_datetime64_any_dtype(values):
+            continue
+        if values.dt.tz is None and not (values.dt.microsecond.any() or values.dt.nanosecond.any()):
+            # Whole-second naive timestamps: one vectorized format call matches isoformat()
+            df[cname] = values.dt.strftime("%Y-%m-%dT%H:%M:%S")
+        else:
+            df[cname] = values.map(lambda ts: ts.isoformat(), na_action="ignore")
+    return df
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for pandas' missing-value sentinels in nullable/extension columns."""
+    if obj is pd.NA or obj is pd.NaT:
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _generate_json(request: GenerationRequest) -> bytes:
+    """
+    Run the synchronous, CPU-bound generation pipeline for a request and return the JSON body.
+    """
+    # 1. Parse the graph dictionary from the request body
+    # Reconstruct the graph dictionary to pass to the parser
+    graph_dict = {
+        "nodes": request.nodes,
+        "edges": request.edges,
+        "constraints": request.constraints or []
+    }
+    # Identical graphs serialize to identical bytes; copy the cached schema since it's mutated below
+    working_schema = clone_schema(_parse_graph_cached(graph_dict))
+
+    # 2. Inject settings from the request into the working schema
+    if request.options:
+        working_schema.setdefault("metadata", {})["default_locale"] = request.options.locale
+        if request.options.row_counts:
+            by_name = {t["name"]: t for t in working_schema.get("tables", [])}
+            for name, rows in request.options.row_counts.items():
+                if name in by_name:
+                    by_name[name]["rows"] = rows
+
+    # 3. Run the existing generation and validation pipeline
+    generated_tables = generate_scenario_data(working_schema)
+    validated_tables = post_generation_validate(generated_tables, working_schema)
+
+    # 4. Serialize the records with orjson and return the body as-is, skipping FastAPI's
+    #    jsonable_encoder pass over every cell. Floats keep full precision; NaN becomes null
+    payload = {
+        table_name: _format_datetime_columns(df).to_dict(orient="records")
+        for table_name, df in validated_tables.items()
+    }
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY, default=_json_default)
+
+
+@app.post("/generate")
 async def generate_data_endpoint(request: GenerationRequest):
     """
     Generate and return synthetic data based on a graph definition.
+    The pipeline runs in a worker thread so it doesn't block the event loop for other requests.
     """
     try:
-        # 1. Parse the graph dictionary from the request body
-        # Reconstruct the graph dictionary to pass to the parser
-        graph_dict = {
-            "nodes": request.nodes,
-            "edges": request.edges,
-            "constraints": request.constraints or []
-        }
-        working_schema = parse_graph_from_dict(graph_dict)
-
-        # 2. Inject settings from the request into the working schema
-        if request.options:
-            working_schema.setdefault("metadata", {})["default_locale"] = request.options.locale
-            if request.options.row_counts:
-                for table in working_schema.get("tables", []):
-                    if table["name"] in request.options.row_counts:
-                        table["rows"] = request.options.row_counts[table["name"]]
-
-        # 3. Run the existing generation and validation pipeline
-        generated_tables = generate_scenario_data(working_schema)
-        validated_tables = post_generation_validate(generated_tables, working_schema)
-
-        # 4. Convert pandas DataFrames to JSON-friendly format and return
-        output = {
-            table_name: df.to_dict(orient="records")
-            for table_name, df in validated_tables.items()
-        }
-        return output
+        content = await asyncio.to_thread(_generate_json, request)
+        return Response(content=content, media_type="application/json")
 
     except Exception as e:
         # Catch any errors from the generation pipeline and return a 500 error
-        raise HTTPException(status_code=500, detail=f"An error occurred during data generation: {e}")
+        raise HTTPException(status_code=500, detail=f"An error occurred during data generation: {e}") from e
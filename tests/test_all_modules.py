@@ -1,37 +1,180 @@
+import copy
 import os
-import json
-from core.graph_parser import parse_graph
+import pytest
+import warnings
+import pandas as pd
+from core.graph_parser import clone_schema, parse_graph
 from core.scenario_data_generator import generate_scenario_data
 from core.post_validator import post_generation_validate
+from core.causal_data_generator import generate_causal_by_scm
+from core.constraint_enforcer import enforce_constraints
+from core.fk_manager import assign_foreign_key
 from core.file_exporter import export_all_tables
 
-def test_graph_pipeline():
-    # Check graph file exists
-    graph_path = os.path.join("config", "test_graph.json")
-    assert os.path.exists(graph_path), "Graph file missing in config/"
+GRAPH_PATH = os.path.join("config", "test_graph.json")
+
+
+# Each stage feeds the next, so the pipeline runs once per module and every stage gets its own test
+@pytest.fixture(scope="module")
+def working_schema():
+    return parse_graph(GRAPH_PATH)
+
+
+@pytest.fixture(scope="module")
+def tables(working_schema):
+    return generate_scenario_data(working_schema)
+
+
+@pytest.fixture(scope="module")
+def validated(tables, working_schema):
+    return post_generation_validate(tables, working_schema)
+
 
-    # Parse graph
-    working_schema = parse_graph(graph_path)
+def test_parse_graph(working_schema):
+    # Check graph file exists
+    assert os.path.exists(GRAPH_PATH), "Graph file missing in config/"
     assert "tables" in working_schema and "edges" in working_schema, "Parsed schema invalid"
 
-    # Generate data
-    tables = generate_scenario_data(working_schema)
+
+def test_clone_schema(working_schema):
+    clone = clone_schema(working_schema)
+    assert clone == copy.deepcopy(working_schema), "Clone differs from deepcopy"
+    clone["tables"][0]["columns"].append({"name": "extra"})
+    assert clone != working_schema, "Clone shares nested objects with the original"
+
+
+def test_generate_scenario_data(tables):
     assert isinstance(tables, dict) and len(tables) > 0, "No tables generated"
     for tname, df in tables.items():
         assert not df.empty, f"Table {tname} is empty"
 
-    # Post-generation validation
-    validated = post_generation_validate(tables, working_schema)
+
+def test_post_generation_validate(validated):
     assert isinstance(validated, dict), "Post-validation failed"
 
+
+def test_post_generation_validate_sees_filtered_parent_rows():
+    # P drops id=2 (null in a non-nullable column); C2 is validated after P and must not keep pid=2
+    tables = {
+        "C1": pd.DataFrame({"pid": [1, 2]}),
+        "P": pd.DataFrame({"id": [1, 2, 3], "v": [1, None, 3]}),
+        "C2": pd.DataFrame({"pid": [1, 2, 3]}),
+    }
+    fk = {"name": "pid", "foreign_key": {"table": "P", "column": "id"}}
+    spec = {"tables": [
+        {"name": "C1", "columns": [fk]},
+        {"name": "P", "columns": [{"name": "id"}, {"name": "v", "nullable": False}]},
+        {"name": "C2", "columns": [fk]},
+    ]}
+    out = post_generation_validate(tables, spec)
+    assert out["P"]["id"].tolist() == [1, 3]
+    assert out["C1"]["pid"].tolist() == [1, 2]
+    assert out["C2"]["pid"].isna().tolist() == [False, True, False]
+
+
+def _validate_reference(all_tables, spec):
+    """The original per-column validator: FK invalidation, then drop_duplicates per unique column, then not-null filters."""
+    for table in spec["tables"]:
+        df = all_tables.get(table["name"])
+        if df is None:
+            continue
+        for col in table.get("columns", []):
+            fk = col.get("foreign_key")
+            parent_df = all_tables.get(fk["table"]) if fk else None
+            if parent_df is not None and fk["column"] in parent_df.columns:
+                invalid_mask = ~df[col["name"]].isin(set(parent_df[fk["column"]].dropna().unique().tolist()))
+                if invalid_mask.any():
+                    df.loc[invalid_mask, col["name"]] = None
+        for col in table.get("columns", []):
+            if col.get("unique", False) and col["name"] in df.columns:
+                df = df.drop_duplicates(subset=[col["name"]])
+        for col in table.get("columns", []):
+            if not col.get("nullable", True) and col["name"] in df.columns:
+                df = df[df[col["name"]].notnull()]
+        all_tables[table["name"]] = df
+    return all_tables
+
+
+def test_post_generation_validate_matches_reference():
+    tables = {
+        "P": pd.DataFrame({"id": [1, 2, 2, 3, 4], "label": ["a", "b", "c", None, "e"]}),
+        "C": pd.DataFrame({
+            "id": [1, 1, 2, 3, 3, 4, 5, 6],
+            "code": ["a", "b", "b", "c", "d", None, "e", "a"],
+            "pid": [1, 9, 2, None, 4, 3, 8, 2],
+            "name": ["x", None, "y", "z", "w", "v", "u", "t"],
+        }),
+    }
+    spec = {"tables": [
+        {"name": "C", "columns": [
+            {"name": "id", "unique": True},
+            {"name": "code", "unique": True},
+            {"name": "pid", "foreign_key": {"table": "P", "column": "id"}},
+            {"name": "name", "nullable": False},
+        ]},
+        {"name": "P", "columns": [{"name": "id", "unique": True}, {"name": "label", "nullable": False}]},
+    ]}
+    # FK invalidation, several unique columns and not-null filters, in both table orders
+    for order in (spec["tables"], spec["tables"][::-1]):
+        ordered = {"tables": order}
+        expected = _validate_reference({k: v.copy() for k, v in tables.items()}, ordered)
+        actual = post_generation_validate({k: v.copy() for k, v in tables.items()}, ordered)
+        for name in tables:
+            pd.testing.assert_frame_equal(actual[name], expected[name])
+
+
+@pytest.mark.parametrize("condition", [
+    lambda df: df["active"],  # callable over the whole frame
+    pd.Series([True, False, True, False]),  # boolean mask
+    {"col": "active", "value": True},
+])
+def test_assign_foreign_key_conditions(condition):
+    child = pd.DataFrame({"pid": [0] * 4, "active": [True, False, True, False]})
+    parent = pd.DataFrame({"id": [7, 8]})
+    with warnings.catch_warnings():
+        warnings.simplefilter("error", DeprecationWarning)
+        out = assign_foreign_key(child, "pid", parent, "id", condition, seed=1)
+    assert out["pid"].isna().tolist() == [False, True, False, True]
+    assert set(out["pid"].dropna()) <= {7, 8}
+    assert child["pid"].tolist() == [0] * 4, "Caller's frame was modified"
+
+
+def test_assign_foreign_key_row_wise_callable_is_deprecated():
+    child = pd.DataFrame({"pid": [0] * 4, "active": [True, False, True, False]})
+    parent = pd.DataFrame({"id": [7, 8]})
+    with pytest.warns(DeprecationWarning):
+        out = assign_foreign_key(child, "pid", parent, "id", lambda row: bool(row["active"]), seed=1)
+    assert out["pid"].isna().tolist() == [False, True, False, True]
+
+
+def test_enforce_constraints_regex_keeps_matching_nulls():
+    # Missing values are matched as "None"/"nan", so a catch-all pattern keeps them
+    df = pd.DataFrame({"email": ["a@b.com", None, "oops"]})
+    assert len(enforce_constraints(df, [{"type": "regex", "column": "email", "pattern": ".*"}])) == 3
+    kept = enforce_constraints(df, [{"type": "regex", "column": "email", "pattern": ".+@.+"}])
+    assert kept["email"].tolist() == ["a@b.com"]
+
+
+def test_generate_causal_by_scm_scalar_expressions():
+    # Expressions that only work on scalars fall back to row-wise evaluation
+    df = pd.DataFrame({"age": [20, 40, 35]})
+    out = generate_causal_by_scm(df, {
+        "senior": {"fn": "1 if age > 30 else 0"},
+        "floor": {"fn": "max(age, 30)"},
+        "jitter": {"fn": "np.random.normal(0, 1)"},
+    })
+    assert out["senior"].tolist() == [0, 1, 1]
+    assert out["floor"].tolist() == [30, 40, 35]
+    assert out["jitter"].nunique() == 3, "Expected an independent draw per row"
+
+
+def test_export_all_tables(validated):
     # Export (to a temp folder)
     out_dir = "data/output/test_run"
     paths = export_all_tables(validated, out_dir, fmt="csv")
     for tname, path in paths.items():
         assert os.path.exists(path), f"Export failed for table {tname}"
 
-    print("All graph-based pipeline tests passed!")
-
 
 if __name__ == "__main__":
-    test_graph_pipeline()
+    raise SystemExit(pytest.main([__file__]))
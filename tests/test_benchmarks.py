@@ -0,0 +1,52 @@
+import os
+import pytest
+
+# Stage benchmarks need pytest-benchmark (pip install -r requirements-dev.txt); skipped without it
+pytest.importorskip("pytest_benchmark")
+
+from core.graph_parser import parse_graph
+from core.scenario_data_generator import generate_scenario_data
+from core.post_validator import post_generation_validate
+from core.file_exporter import export_all_tables
+
+GRAPH_PATH = os.path.join("config", "test_graph.json")
+ROW_COUNTS = [100, 10_000, 100_000]
+
+
+def _schema_with_rows(rows):
+    schema = parse_graph(GRAPH_PATH)
+    for table in schema["tables"]:
+        table["rows"] = rows
+    return schema
+
+
+@pytest.mark.benchmark(group="parse_graph")
+def test_bench_parse_graph(benchmark):
+    schema = benchmark(parse_graph, GRAPH_PATH)
+    assert "tables" in schema
+
+
+@pytest.mark.benchmark(group="generate_scenario_data")
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_bench_generate_scenario_data(benchmark, rows):
+    schema = _schema_with_rows(rows)
+    tables = benchmark(generate_scenario_data, schema)
+    assert tables
+
+
+@pytest.mark.benchmark(group="post_generation_validate")
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+def test_bench_post_generation_validate(benchmark, rows):
+    schema = _schema_with_rows(rows)
+    tables = generate_scenario_data(schema)
+    # Validation replaces frames in the dict it is given, so every round gets a fresh one
+    validated = benchmark(lambda: post_generation_validate(dict(tables), schema))
+    assert isinstance(validated, dict)
+
+
+@pytest.mark.benchmark(group="export_all_tables")
+@pytest.mark.parametrize("fmt", ["csv", "json", "parquet"])
+def test_bench_export_all_tables(benchmark, tmp_path, fmt):
+    tables = generate_scenario_data(_schema_with_rows(10_000))
+    paths = benchmark(export_all_tables, tables, str(tmp_path), fmt)
+    assert all(os.path.exists(p) for p in paths.values())